@@ -0,0 +1,58 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for Christ In Song Hymnal
+File: installer/build_windows.spec
+
+Builds in onedir mode (dist/ChristInSong/ChristInSong.exe plus its support
+files) so the application starts without unpacking itself to %TEMP% on
+every launch. Usage: pyinstaller --clean installer/build_windows.spec
+"""
+from pathlib import Path
+
+project_root = Path(SPECPATH).parent
+src_dir = project_root / "src"
+package_dir = src_dir / "christ_in_song"
+
+a = Analysis(
+    [str(package_dir / "main.py")],
+    pathex=[str(src_dir)],
+    binaries=[],
+    # Config.get_resource_path() resolves resources relative to sys._MEIPASS;
+    # the sample hymns are read relative to the database package
+    datas=[
+        (str(package_dir / "resources"), "."),
+        (str(package_dir / "database" / "sample_hymns.json"), "christ_in_song/database"),
+    ],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="ChristInSong",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    icon=str(project_root / "installer" / "windows" / "icon.ico"),
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name="ChristInSong",
+)
@@ -0,0 +1,55 @@
+"""
+Build the pre-seeded database shipped with the application
+File: scripts/build_seed_db.py
+
+Runs the normal first-run initialization (schema, categories, sample hymns,
+settings) once at build time. On first launch the application copies the
+result instead of seeding a new database itself.
+
+Usage: python scripts/build_seed_db.py
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from christ_in_song.config import Config
+from christ_in_song.database.connection import DatabaseManager
+
+SEED_DB_PATH = Config.get_resource_path(Config.SEED_DATABASE_NAME)
+
+
+def build_seed_database(output_path: Path) -> bool:
+    """Create a freshly initialized database at output_path"""
+    for path in (output_path, Path(f"{output_path}-wal"), Path(f"{output_path}-shm")):
+        if path.exists():
+            path.unlink()
+
+    db_manager = DatabaseManager(output_path)
+    if not db_manager.initialize_database():
+        return False
+
+    # Ship a single self-contained, compacted file rather than a WAL database
+    conn = db_manager.connection
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.execute("VACUUM")
+    db_manager.close()
+    return True
+
+
+def main():
+    """Main build function"""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    logger = logging.getLogger(__name__)
+
+    if not build_seed_database(SEED_DB_PATH):
+        logger.error("Failed to build seed database")
+        sys.exit(1)
+
+    logger.info(f"✅ Seed database written to: {SEED_DB_PATH}")
+
+
+if __name__ == "__main__":
+    main()
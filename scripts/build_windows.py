@@ -3,21 +3,23 @@
 Windows build script for Christ In Song Hymnal
 Automates the build process using PyInstaller and Inno Setup
 """
+import hashlib
 import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd, description):
+def run_command(cmd, description, env=None):
     """Run a command and handle errors"""
     print(f"\\n{'='*70}")
     print(f"{description}")
     print(f"{'='*70}")
     print(f"Running: {' '.join(cmd)}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
     
     if result.returncode != 0:
         print(f"\\n❌ ERROR: {description} failed!")
@@ -28,6 +30,32 @@ def run_command(cmd, description):
     return result
 
 
+def fast_rmtree(path):
+    """Remove a directory tree using the platform's native tool, falling back to shutil"""
+    if sys.platform == "win32":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+    
+    try:
+        subprocess.run(cmd, check=False)
+    except OSError:
+        pass
+    
+    # The native tools don't report partial failures reliably
+    if Path(path).exists():
+        shutil.rmtree(path)
+
+
+def file_sha256(path):
+    """Compute the SHA-256 checksum of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def main():
     """Main build function"""
     print("""
@@ -44,18 +72,28 @@ def main():
     print("\\n🧹 Cleaning previous builds...")
     for directory in ['build', 'dist']:
         if Path(directory).exists():
-            shutil.rmtree(directory)
+            fast_rmtree(directory)
             print(f"  Removed: {directory}")
     
-    # Step 2: Run PyInstaller
+    # Step 2: Build the pre-seeded database bundled with the app
+    run_command(
+        [sys.executable, str(project_root / "scripts" / "build_seed_db.py")],
+        "Building seed database",
+    )
+    
+    # Step 3: Run PyInstaller
     spec_file = project_root / "installer" / "build_windows.spec"
+    # PyInstaller bundles bytecode at the interpreter's optimization level;
+    # -O strips asserts (the app doesn't rely on them) for smaller .pyc files
     run_command(
         ["pyinstaller", "--clean", str(spec_file)],
-        "Building executable with PyInstaller"
+        "Building executable with PyInstaller",
+        env={**os.environ, "PYTHONOPTIMIZE": "1"},
     )
     
-    # Step 3: Verify executable exists
-    exe_path = project_root / "dist" / "ChristInSong.exe"
+    # Step 4: Verify executable exists
+    # Onedir build: the executable sits next to its support files
+    exe_path = project_root / "dist" / "ChristInSong" / "ChristInSong.exe"
     if not exe_path.exists():
         print(f"\\n❌ ERROR: Executable not found at {exe_path}")
         sys.exit(1)
@@ -63,26 +101,33 @@ def main():
     print(f"\\n✅ Executable created: {exe_path}")
     print(f"   Size: {exe_path.stat().st_size / (1024*1024):.2f} MB")
     
-    # Step 4: Check for Inno Setup (optional)
-    inno_setup_path = Path("C:/Program Files (x86)/Inno Setup 6/ISCC.exe")
-    
-    if inno_setup_path.exists():
-        print("\\n📦 Creating Windows installer with Inno Setup...")
-        iss_file = project_root / "installer" / "windows" / "christ_in_song.iss"
+    # The checksum only needs the executable, so hash it in the background
+    # while Inno Setup compresses the same files on the main thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        exe_hash_future = executor.submit(file_sha256, exe_path)
         
-        run_command(
-            [str(inno_setup_path), str(iss_file)],
-            "Building installer with Inno Setup"
-        )
+        # Step 5: Check for Inno Setup (optional)
+        inno_setup_path = Path("C:/Program Files (x86)/Inno Setup 6/ISCC.exe")
         
-        installer_path = project_root / "dist" / "ChristInSongSetup_v1.0.0.exe"
-        if installer_path.exists():
-            print(f"\\n✅ Installer created: {installer_path}")
-            print(f"   Size: {installer_path.stat().st_size / (1024*1024):.2f} MB")
-    else:
-        print("\\n⚠️  Inno Setup not found. Skipping installer creation.")
-        print("   Download from: https://jrsoftware.org/isdl.php")
-        print("   Install and re-run this script to create installer.")
+        if inno_setup_path.exists():
+            print("\\n📦 Creating Windows installer with Inno Setup...")
+            iss_file = project_root / "installer" / "windows" / "christ_in_song.iss"
+        
+            run_command(
+                [str(inno_setup_path), str(iss_file)],
+                "Building installer with Inno Setup"
+            )
+        
+            installer_path = project_root / "dist" / "ChristInSongSetup_v1.0.0.exe"
+            if installer_path.exists():
+                print(f"\\n✅ Installer created: {installer_path}")
+                print(f"   Size: {installer_path.stat().st_size / (1024*1024):.2f} MB")
+        else:
+            print("\\n⚠️  Inno Setup not found. Skipping installer creation.")
+            print("   Download from: https://jrsoftware.org/isdl.php")
+            print("   Install and re-run this script to create installer.")
+        
+        print(f"\\n🔒 Executable SHA-256: {exe_hash_future.result()}")
     
     print("""
 ╔══════════════════════════════════════════════════════════════════════════╗
@@ -91,8 +136,9 @@ def main():
 
 Your application is ready for distribution:
 
-📁 Standalone executable: dist/ChristInSong.exe
-   - Can be run directly without installation
+📁 Application folder: dist/ChristInSong/
+   - Run dist/ChristInSong/ChristInSong.exe directly without installation
+   - Copy the whole folder; the executable needs the files next to it
    - ~50-100 MB (includes Python + PySide6)
 
 📦 Windows installer: dist/ChristInSongSetup_v1.0.0.exe
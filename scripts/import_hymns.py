@@ -4,21 +4,31 @@ File: scripts/import_hymns.py
 
 Usage: python scripts/import_hymns.py
 """
+import gzip
 import json
+import re
 import sys
 import logging
 from pathlib import Path
-from urllib.request import urlopen
+from typing import Iterable, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from christ_in_song.config import Config
 from christ_in_song.database.connection import DatabaseManager
+from christ_in_song.database.schema import HYMNS_FTS_TRIGGERS
 
 # URL to the English hymnal JSON
 HYMNAL_URL = "https://raw.githubusercontent.com/TinasheMzondiwa/cis-hymnals/main/english.json"
 
+# Local copy of the last download (gzip-compressed) and its ETag, used to
+# skip the transfer when the hymnal hasn't changed upstream
+HYMNAL_CACHE_NAME = "hymnal_cache.json.gz"
+HYMNAL_ETAG_NAME = "hymnal_cache.etag"
+
 # Category mapping from content to our categories
 CATEGORY_MAPPING = {
     "worship": "Worship and Praise",
@@ -54,9 +64,31 @@ CATEGORY_MAPPING = {
     "witness": "Testimony",
 }
 
+# Single-pass keyword scanner. The lookahead reports every (possibly
+# overlapping) keyword occurrence, so the earliest keyword in CATEGORY_MAPPING
+# order can still be chosen, matching a plain substring check per keyword.
+_KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in CATEGORY_MAPPING) + "))")
+_KEYWORD_PRIORITY = {keyword: index for index, keyword in enumerate(CATEGORY_MAPPING)}
+
+# SQLite settings for the import session. This is the user's live database
+# (favorites, settings, usage stats), so the journal mode stays WAL: if the
+# script crashes or is killed, the unfinished import transaction is rolled
+# back and the file stays intact. Only fsyncs are skipped, which leaves the
+# file exposed to an OS crash or power loss while the import runs.
+BULK_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+
 
 def setup_logging():
-    """Setup logging"""
+    """
+    Setup logging
+
+    Records are written synchronously: the script interleaves log lines with
+    print() and input(), so a background writer would reorder them.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(levelname)s - %(message)s",
@@ -65,42 +97,89 @@ def setup_logging():
 
 
 def download_hymnal_json(url: str):
-    """Download the hymnal JSON from GitHub"""
+    """Download the hymnal JSON from GitHub, reusing the cached copy if unchanged"""
     logger = logging.getLogger(__name__)
     logger.info(f"Downloading hymnal data from: {url}")
 
+    cache_path = Config.get_user_data_dir() / HYMNAL_CACHE_NAME
+    etag_path = Config.get_user_data_dir() / HYMNAL_ETAG_NAME
+
+    headers = {"Accept-Encoding": "gzip"}
+    if cache_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
     try:
-        with urlopen(url) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            logger.info(f"Successfully downloaded hymnal data")
-            return data
+        with urlopen(Request(url, headers=headers)) as response:
+            body = response.read()
+            etag = response.headers.get("ETag")
+            if response.headers.get("Content-Encoding") == "gzip":
+                compressed = body
+                body = gzip.decompress(body)
+            else:
+                compressed = gzip.compress(body)
+
+        cache_path.write_bytes(compressed)
+        if etag:
+            etag_path.write_text(etag)
+        elif etag_path.exists():
+            etag_path.unlink()
+        logger.info(f"Successfully downloaded hymnal data")
+
+    except HTTPError as e:
+        if e.code != 304:
+            logger.error(f"Failed to download hymnal: {e}")
+            raise
+        logger.info("Hymnal data unchanged since last download, using cached copy")
+        body = gzip.decompress(cache_path.read_bytes())
     except Exception as e:
         logger.error(f"Failed to download hymnal: {e}")
         raise
 
+    # json.loads detects the encoding of bytes itself; no intermediate str copy
+    return json.loads(body)
 
-def determine_category(hymn_data: dict, db_manager: DatabaseManager) -> int:
-    """Determine the best category for a hymn based on its content"""
-    # Get all categories
-    categories = db_manager.get_categories()
-    category_map = {cat["name"]: cat["id"] for cat in categories}
 
-    # Default to "Christian Life"
-    default_category = category_map.get("Christian Life")
+def match_category_keyword(text: str) -> Optional[str]:
+    """Return the highest-priority CATEGORY_MAPPING keyword found in text"""
+    matches = _KEYWORD_RE.findall(text)
+    if not matches:
+        return None
+    return min(matches, key=_KEYWORD_PRIORITY.__getitem__)
+
 
-    # Check title and content for keywords
-    title = hymn_data.get("title", "").lower()
-    content = hymn_data.get("content", "").lower()
-    combined_text = f"{title} {content[:500]}"  # First 500 chars of content
+def determine_category(
+    title_text: str, content_text: str, category_map: dict, default_category_id: int
+) -> int:
+    """
+    Determine the best category for a hymn based on its content
 
+    The title usually decides the category, so it is scanned on its own first
+    and the content is only scanned when the title has no keyword. Both texts
+    must already be case-folded (see import_hymns).
+    """
     # Try to match keywords - prioritize by order
-    for keyword, category_name in CATEGORY_MAPPING.items():
-        if keyword in combined_text:
-            cat_id = category_map.get(category_name)
-            if cat_id:
-                return cat_id
+    keyword = match_category_keyword(title_text) or match_category_keyword(content_text)
+    if keyword:
+        cat_id = category_map.get(CATEGORY_MAPPING[keyword])
+        if cat_id:
+            return cat_id
 
-    return default_category
+    return default_category_id
+
+
+def begin_bulk_load(conn) -> dict:
+    """Apply BULK_LOAD_PRAGMAS to a connection and return the previous values"""
+    previous = {}
+    for name, value in BULK_LOAD_PRAGMAS.items():
+        previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+        conn.execute(f"PRAGMA {name} = {value}")
+    return previous
+
+
+def end_bulk_load(conn, previous: dict):
+    """Restore the PRAGMA values returned by begin_bulk_load"""
+    for name, value in previous.items():
+        conn.execute(f"PRAGMA {name} = {value}")
 
 
 def parse_hymn_content(content: str) -> tuple:
@@ -109,84 +188,129 @@ def parse_hymn_content(content: str) -> tuple:
         return "", None
 
     # The content is already formatted with verse numbers
-    # Just clean it up a bit
-    lines = content.strip().split("\n")
-    cleaned_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        if line:  # Skip empty lines
-            cleaned_lines.append(line)
-    
-    # Join with proper spacing
-    verses_text = "\n".join(cleaned_lines)
-    
+    # Just clean it up a bit: strip each line and drop empty ones
+    verses_text = "\n".join(
+        stripped for stripped in (line.strip() for line in content.splitlines()) if stripped
+    )
+
     # For now, we don't extract chorus separately
     # The format doesn't clearly separate it
     return verses_text, None
 
 
-def import_hymns(db_manager: DatabaseManager, hymns_data: list):
-    """Import hymns from the JSON data into the database"""
-    logger = logging.getLogger(__name__)
+def validate_hymn(hymn_data) -> Tuple[Optional[tuple], Optional[str]]:
+    """
+    Check one hymn entry from the JSON data
 
-    if not hymns_data or not isinstance(hymns_data, list):
-        logger.error("Invalid hymnal data format - expected a list of hymns")
-        return
+    Returns ((number, title, content), None) for a complete hymn, or
+    (None, reason) when it has to be skipped.
+    """
+    if not isinstance(hymn_data, dict):
+        return None, "not a JSON object"
+
+    number = hymn_data.get("number")
+    title = hymn_data.get("title")
+    content = hymn_data.get("content")
+
+    if not number:
+        return None, "missing number"
+    if not isinstance(title, str) or not title.strip():
+        return None, "missing or non-text title"
+    if not isinstance(content, str) or not content.strip():
+        return None, "missing or non-text content"
 
-    logger.info(f"Found {len(hymns_data)} hymns to import")
+    return (number, title.strip(), content.strip()), None
 
-    # Clear existing hymns (optional - comment out if you want to keep sample data)
-    logger.info("Clearing existing hymns...")
-    with db_manager.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM hymns")
-        cursor.execute("DELETE FROM hymns_fts")
-        logger.info("Existing hymns cleared")
+
+def import_hymns(db_manager: DatabaseManager, hymns_data: Iterable[dict]):
+    """
+    Import hymns from the JSON data into the database
+
+    hymns_data is consumed in a single pass, so any iterable of hymn dicts
+    works, including a generator streaming them from a parser.
+    """
+    logger = logging.getLogger(__name__)
 
     imported_count = 0
-    error_count = 0
+    rows_to_insert = []
+
+    # Categories don't change during an import, so look them up once
+    categories = db_manager.get_categories()
+    category_map = {cat["name"]: cat["id"] for cat in categories}
+    # Default to "Christian Life"
+    default_category_id = category_map.get("Christian Life")
 
+    # Validate everything up front; only complete hymns are prepared below
+    found_count = 0
+    error_count = 0
+    valid_hymns = []
     for hymn_data in hymns_data:
-        try:
-            # Extract hymn data
-            number = hymn_data.get("number")
-            title = hymn_data.get("title", "").strip()
-            content = hymn_data.get("content", "").strip()
-
-            if not number or not title or not content:
-                logger.warning(f"Skipping hymn with incomplete data: {hymn_data.get('number', '?')}")
-                error_count += 1
-                continue
-
-            # Parse content into verses
-            verses, chorus = parse_hymn_content(content)
-
-            # Determine category
-            category_id = determine_category(hymn_data, db_manager)
-
-            # Insert hymn
-            with db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO hymns 
-                    (number, title, verses, chorus, category_id)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (number, title, verses, chorus, category_id),
-                )
-
-            imported_count += 1
-
-            # Progress indicator
-            if imported_count % 50 == 0:
-                logger.info(f"Imported {imported_count} hymns...")
-
-        except Exception as e:
-            logger.error(f"Error importing hymn {hymn_data.get('number', '?')}: {e}")
+        found_count += 1
+        fields, problem = validate_hymn(hymn_data)
+        if problem:
+            number = hymn_data.get("number", "?") if isinstance(hymn_data, dict) else "?"
+            logger.warning(f"Skipping hymn {number}: {problem}")
             error_count += 1
             continue
+        valid_hymns.append(fields)
+
+    logger.info(f"Found {found_count} hymns to import")
+    if error_count:
+        logger.warning(f"Skipped {error_count} hymns with incomplete data")
+
+    # Pass 1: prepare every row without touching the database
+    next_progress_at = 50
+    for number, title, content in valid_hymns:
+        # Parse content into verses
+        verses, chorus = parse_hymn_content(content)
+
+        # Determine category from the title, then the first 500 chars of content
+        category_id = determine_category(
+            title.casefold(), content[:500].casefold(), category_map, default_category_id
+        )
+
+        rows_to_insert.append((number, title, verses, chorus, category_id))
+
+        # Progress indicator
+        if len(rows_to_insert) >= next_progress_at:
+            logger.info(f"Prepared {len(rows_to_insert)} hymns...")
+            next_progress_at += 50
+
+    if not rows_to_insert:
+        logger.error("No valid hymns found - leaving existing hymns untouched")
+        return
+
+    # Pass 2: replace the existing hymns in a single transaction
+    logger.info("Clearing existing hymns and inserting new ones...")
+    # PRAGMAs can't change inside a transaction, so set them first
+    previous_pragmas = begin_bulk_load(db_manager.connection)
+    try:
+        with db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Drop the FTS sync triggers so rows aren't tokenized one at a time;
+            # the index is rebuilt in one pass once all hymns are in place
+            for trigger_name in HYMNS_FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+
+            cursor.execute("DELETE FROM hymns")
+            cursor.executemany(
+                """
+                INSERT INTO hymns 
+                (number, title, verses, chorus, category_id)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows_to_insert,
+            )
+
+            cursor.execute("INSERT INTO hymns_fts(hymns_fts) VALUES ('rebuild')")
+            for trigger_sql in HYMNS_FTS_TRIGGERS.values():
+                cursor.execute(trigger_sql)
+
+        imported_count = len(rows_to_insert)
+        db_manager.clear_cache()
+    finally:
+        end_bulk_load(db_manager.connection, previous_pragmas)
 
     logger.info("=" * 70)
     logger.info(f"✅ Import completed!")
@@ -209,13 +333,9 @@ def main():
         logger.info("Initializing database connection...")
         db_manager = DatabaseManager()
 
-        # Make sure database is initialized
-        if not db_manager.db_path.exists():
-            logger.info("Database doesn't exist, initializing...")
-            db_manager.initialize_database()
-        else:
-            # Ensure database schema is up to date
-            db_manager.initialize_database()
+        # Make sure database exists and its schema is up to date; this is a
+        # no-op when the schema is already current
+        db_manager.initialize_database()
 
         # Download hymnal JSON
         logger.info("Downloading hymnal data from GitHub...")
@@ -271,6 +391,8 @@ def main():
         if backup_path:
             print(f"✅ Backup created: {backup_path}")
 
+        db_manager.close()
+
         print("\n" + "=" * 70)
         print("✅ IMPORT COMPLETED SUCCESSFULLY!")
         print("=" * 70 + "\n")
@@ -60,7 +60,7 @@ echo.
 pyinstaller --clean installer\build_windows.spec
 
 REM Check if build succeeded
-if exist "dist\ChristInSong.exe" (
+if exist "dist\ChristInSong\ChristInSong.exe" (
     echo.
     echo ╔══════════════════════════════════════════════════════════════════════════╗
     echo ║                         BUILD SUCCESSFUL! 🎉                              ║
@@ -68,18 +68,18 @@ if exist "dist\ChristInSong.exe" (
     echo.
     echo ✅ Your application has been built!
     echo.
-    echo 📁 Location: dist\ChristInSong.exe
+    echo 📁 Location: dist\ChristInSong\ChristInSong.exe
     
     REM Get file size
-    for %%A in (dist\ChristInSong.exe) do (
+    for %%A in (dist\ChristInSong\ChristInSong.exe) do (
         set size=%%~zA
         set /a sizeMB=%%~zA/1048576
     )
     echo 📊 Size: ~%sizeMB% MB
     echo.
     echo 🚀 What's next?
-    echo    1. Test the executable: dist\ChristInSong.exe
-    echo    2. Copy it to another computer to verify it works standalone
+    echo    1. Test the executable: dist\ChristInSong\ChristInSong.exe
+    echo    2. Copy the dist\ChristInSong folder to another computer to verify it works standalone
     echo    3. Distribute to users!
     echo.
     echo 💡 Optional: Create a professional installer
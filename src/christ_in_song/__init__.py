@@ -11,6 +11,17 @@ __version__ = "0.0.1"
 __author__ = "Carrington Muleya"
 __license__ = "MIT"
 
-from christ_in_song.main import main
+__all__ = ["main"]
 
-__all__ = ["main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the Qt entry point lazily so that importing a submodule such as
+    # christ_in_song.config or christ_in_song.database doesn't load PySide6
+    if name == "main":
+        from christ_in_song.main import main
+
+        # Importing the submodule binds the module object to the package
+        # attribute; rebind the function like the eager import used to
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,11 +1,15 @@
 """
 Configuration management for Christ In Song application
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import sys
 import os
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QIcon
+
 
 class Config:
     """Application configuration manager"""
@@ -19,6 +23,8 @@ class Config:
     
     # Database
     DATABASE_NAME = "christ_in_song.db"
+    # Pre-seeded database in resources/, built by scripts/build_seed_db.py
+    SEED_DATABASE_NAME = "seed.db"
     
     # UI Settings
     DEFAULT_WINDOW_WIDTH = 1000
@@ -29,8 +35,9 @@ class Config:
     DEFAULT_THEME = "light"
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_user_data_dir() -> Path:
-        """Get user data directory for the application"""
+        """Get user data directory for the application (created once, then cached)"""
         if sys.platform == "win32":
             base_dir = Path(os.environ.get("APPDATA", Path.home()))
         elif sys.platform == "darwin":
@@ -60,8 +67,21 @@ class Config:
         return base_path / relative_path
     
     @staticmethod
+    @lru_cache(maxsize=None)
+    def get_app_icon() -> Optional["QIcon"]:
+        """Get the application icon, or None if it isn't bundled (loaded once, then cached)"""
+        icon_path = Config.get_resource_path("icons/app_icon.ico")
+        if not icon_path.exists():
+            return None
+        
+        # Imported here so the config module doesn't load Qt
+        from PySide6.QtGui import QIcon
+        return QIcon(str(icon_path))
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
     def get_backup_dir() -> Path:
-        """Get backup directory path"""
+        """Get backup directory path (created once, then cached)"""
         backup_dir = Config.get_user_data_dir() / "backups"
         backup_dir.mkdir(parents=True, exist_ok=True)
         return backup_dir
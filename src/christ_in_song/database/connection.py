@@ -4,45 +4,196 @@ File: src/christ_in_song/database/connection.py
 
 INSTRUCTIONS: Replace your entire connection.py file with this content
 """
+import re
+import shutil
 import sqlite3
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from christ_in_song.config import Config
 from christ_in_song.database.schema import (
     SCHEMA,
+    SCHEMA_VERSION,
     DEFAULT_CATEGORIES,
-    SAMPLE_HYMNS,
+    load_sample_hymns,
     DEFAULT_SETTINGS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Applied once when the shared connection is opened. WAL lets the UI read
+# while a write is in progress, and NORMAL sync is still safe under WAL.
+CONNECTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,  # ~64 MB
+    "mmap_size": 268435456,  # 256 MB
+    "foreign_keys": "ON",
+}
+
+# SQL for the hot paths, kept as constants so each call hits the same entry
+# in the connection's statement cache
+SQL_GET_HYMN = """
+    SELECT h.*, c.name as category_name
+    FROM hymns h
+    LEFT JOIN categories c ON h.category_id = c.id
+    WHERE h.number = ?
+"""
+SQL_ALL_HYMNS = """
+    SELECT h.*, c.name as category_name
+    FROM hymns h
+    LEFT JOIN categories c ON h.category_id = c.id
+    ORDER BY h.number
+    LIMIT ?
+"""
+SQL_HYMN_SUMMARIES = """
+    SELECT h.id, h.number, h.title, c.name as category_name
+    FROM hymns h
+    LEFT JOIN categories c ON h.category_id = c.id
+    ORDER BY h.number
+"""
+SQL_HYMNS_BY_CATEGORY = """
+    SELECT h.*, c.name as category_name
+    FROM hymns h
+    LEFT JOIN categories c ON h.category_id = c.id
+    WHERE h.category_id = ?
+    ORDER BY h.number
+"""
+SQL_IS_FAVORITE = "SELECT EXISTS(SELECT 1 FROM favorites WHERE hymn_id = ?)"
+# REPLACE gives a re-viewed hymn a fresh id, so views that land on the same
+# timestamp still sort in the order they happened
+SQL_ADD_RECENTLY_VIEWED = """
+    INSERT OR REPLACE INTO recently_viewed (hymn_id, viewed_at)
+    VALUES (?, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+"""
+
+SQL_DATABASE_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM hymns) as total_hymns,
+        (SELECT COUNT(*) FROM categories) as total_categories,
+        (SELECT COUNT(*) FROM favorites) as total_favorites,
+        (SELECT value FROM db_metadata WHERE key = 'version') as database_version
+"""
+
+# Most recently opened hymns kept in memory by get_hymn_by_number()
+HYMN_CACHE_SIZE = 256
+
+# How long get_database_stats() reuses the database file size, in seconds
+DATABASE_SIZE_TTL = 5.0
+
+# Bare words (optionally with a trailing * for prefix search) and quoted
+# phrases are passed to FTS5 as-is so AND/OR/NOT keep working; anything else
+# is quoted so punctuation can't be parsed as query syntax
+_FTS_TOKEN_RE = re.compile(r'"[^"]*"|\S+')
+_FTS_BAREWORD_RE = re.compile(r'\w+\*?|"[^"]*"')
+_FTS_OPERATORS = frozenset({"AND", "OR", "NOT"})
+
+
+def _quote_fts_token(token: str) -> str:
+    """Quote a token as an FTS5 string so it is matched literally"""
+    return '"' + token.replace('"', '""') + '"'
+
+
+def build_fts_query(query: str) -> str:
+    """Quote tokens that FTS5 would otherwise reject as syntax errors
+
+    AND/OR/NOT are binary in FTS5, so they are only kept as operators
+    between two search terms; anywhere else ("NOT", "grace AND") they are
+    searched for as words.
+    """
+    tokens = _FTS_TOKEN_RE.findall(query)
+    parts = []
+    for i, token in enumerate(tokens):
+        if token in _FTS_OPERATORS:
+            has_left = bool(parts) and parts[-1] not in _FTS_OPERATORS
+            has_right = i + 1 < len(tokens) and tokens[i + 1] not in _FTS_OPERATORS
+            parts.append(token if has_left and has_right else _quote_fts_token(token))
+        elif _FTS_BAREWORD_RE.fullmatch(token):
+            parts.append(token)
+        else:
+            parts.append(_quote_fts_token(token))
+    return " ".join(parts)
+
 
 class DatabaseManager:
     """Manages database connections and operations"""
 
-    def __init__(self):
-        self.db_path = Config.get_database_path()
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or Config.get_database_path()
         self._connection: Optional[sqlite3.Connection] = None
+        # Serializes use of the shared connection across threads
+        self._lock = threading.RLock()
+        # Read caches for data that rarely changes during a session; cleared
+        # by the methods that write it, or explicitly via clear_cache()
+        self._hymn_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._setting_cache: Dict[str, Optional[str]] = {}
+        self._categories_cache: Optional[List[Dict[str, Any]]] = None
+        # (monotonic time read, size in bytes) for _get_database_size()
+        self._database_size: Optional[tuple] = None
         logger.info(f"Database manager initialized with path: {self.db_path}")
 
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The shared connection, opened on first use"""
+        with self._lock:
+            if self._connection is None:
+                # Autocommit mode; get_connection() manages transactions itself
+                self._connection = sqlite3.connect(
+                    str(self.db_path),
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=256,
+                )
+                self._connection.row_factory = sqlite3.Row  # Enable column access by name
+                for name, value in CONNECTION_PRAGMAS.items():
+                    self._connection.execute(f"PRAGMA {name} = {value}")
+            return self._connection
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        """Context manager for a transaction on the shared connection"""
+        with self._lock:
+            conn = self.connection
+            # Nested use joins the outer transaction instead of committing it
+            owns_transaction = not conn.in_transaction
+            if owns_transaction:
+                conn.execute("BEGIN")
+            try:
+                yield conn
+                if owns_transaction and conn.in_transaction:
+                    conn.execute("COMMIT")
+            except Exception as e:
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                # Also covers GeneratorExit when a row generator is closed early
+                if owns_transaction and conn.in_transaction:
+                    conn.execute("ROLLBACK")
+
+    def clear_cache(self):
+        """Drop cached hymns, settings and categories"""
+        with self._lock:
+            self._hymn_cache.clear()
+            self._setting_cache.clear()
+            self._categories_cache = None
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize failed: {e}")
+                self._connection.close()
+                self._connection = None
+                logger.info("Database connection closed")
 
     def initialize_database(self) -> bool:
         """Initialize the database with schema and default data"""
@@ -52,12 +203,29 @@ class DatabaseManager:
             # Check if database already exists
             is_new_db = not self.db_path.exists()
 
+            # Start from the pre-seeded database shipped with the app, if any
+            if is_new_db:
+                seed_path = Config.get_resource_path(Config.SEED_DATABASE_NAME)
+                if seed_path.exists():
+                    logger.info(f"Copying pre-seeded database from: {seed_path}")
+                    shutil.copyfile(seed_path, self.db_path)
+                    is_new_db = False
+
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
+                # Skip the DDL entirely when the schema is already current
+                cursor.execute("PRAGMA user_version")
+                if not is_new_db and cursor.fetchone()[0] >= SCHEMA_VERSION:
+                    logger.info("Database schema is up to date")
+                    return True
+
                 # Execute schema
                 logger.info("Creating database schema...")
                 cursor.executescript(SCHEMA)
+                # executescript() commits first; keep the seed data in one
+                # write transaction
+                cursor.execute("BEGIN IMMEDIATE")
 
                 if is_new_db:
                     logger.info("New database detected. Loading default data...")
@@ -70,34 +238,31 @@ class DatabaseManager:
                     logger.info(f"Inserted {len(DEFAULT_CATEGORIES)} categories")
 
                     # Insert sample hymns
-                    for hymn in SAMPLE_HYMNS:
-                        # Get category_id
-                        cursor.execute(
-                            "SELECT id FROM categories WHERE name = ?",
-                            (hymn["category"],),
-                        )
-                        category_row = cursor.fetchone()
-                        category_id = category_row["id"] if category_row else None
-
-                        cursor.execute(
-                            """
-                            INSERT INTO hymns 
-                            (number, title, verses, chorus, category_id, author, composer, year, scripture_reference)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
+                    sample_hymns = load_sample_hymns()
+                    cursor.execute("SELECT id, name FROM categories")
+                    category_ids = {row["name"]: row["id"] for row in cursor.fetchall()}
+                    cursor.executemany(
+                        """
+                        INSERT INTO hymns 
+                        (number, title, verses, chorus, category_id, author, composer, year, scripture_reference)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
                             (
                                 hymn["number"],
                                 hymn["title"],
                                 hymn["verses"],
                                 hymn.get("chorus"),
-                                category_id,
+                                category_ids.get(hymn["category"]),
                                 hymn.get("author"),
                                 hymn.get("composer"),
                                 hymn.get("year"),
                                 hymn.get("scripture_reference"),
-                            ),
-                        )
-                    logger.info(f"Inserted {len(SAMPLE_HYMNS)} sample hymns")
+                            )
+                            for hymn in sample_hymns
+                        ],
+                    )
+                    logger.info(f"Inserted {len(sample_hymns)} sample hymns")
 
                     # Insert default settings
                     cursor.executemany(
@@ -106,6 +271,10 @@ class DatabaseManager:
                     )
                     logger.info(f"Inserted {len(DEFAULT_SETTINGS)} default settings")
 
+                # Refresh planner statistics so the new indexes get used
+                cursor.execute("ANALYZE")
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
                 # Verify database
                 cursor.execute("SELECT COUNT(*) as count FROM hymns")
                 hymn_count = cursor.fetchone()["count"]
@@ -126,13 +295,19 @@ class DatabaseManager:
         """Create a backup of the database"""
         try:
             from datetime import datetime
-            import shutil
 
             backup_dir = Config.get_backup_dir()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = backup_dir / f"christ_in_song_backup_{timestamp}.db"
 
-            shutil.copy2(self.db_path, backup_path)
+            # The online backup API copies a consistent snapshot, including
+            # commits still in the WAL, without blocking readers
+            backup_conn = sqlite3.connect(str(backup_path))
+            try:
+                with self._lock:
+                    self.connection.backup(backup_conn, pages=1000)
+            finally:
+                backup_conn.close()
             logger.info(f"Database backed up to: {backup_path}")
             return backup_path
 
@@ -142,41 +317,46 @@ class DatabaseManager:
 
     def get_hymn_by_number(self, number: int) -> Optional[Dict[str, Any]]:
         """Get a hymn by its number"""
+        with self._lock:
+            cached = self._hymn_cache.get(number)
+            if cached is not None:
+                self._hymn_cache.move_to_end(number)
+                return dict(cached)
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT h.*, c.name as category_name
-                    FROM hymns h
-                    LEFT JOIN categories c ON h.category_id = c.id
-                    WHERE h.number = ?
-                    """,
-                    (number,),
-                )
+                cursor.execute(SQL_GET_HYMN, (number,))
                 row = cursor.fetchone()
-                return dict(row) if row else None
+                if row is None:
+                    return None
+                hymn = dict(row)
+                self._hymn_cache[number] = hymn
+                if len(self._hymn_cache) > HYMN_CACHE_SIZE:
+                    self._hymn_cache.popitem(last=False)
+                return dict(hymn)
         except Exception as e:
             logger.error(f"Error fetching hymn {number}: {e}")
             return None
 
-    def search_hymns(self, query: str) -> List[Dict[str, Any]]:
-        """Search hymns using full-text search"""
+    def search_hymns(self, query: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Search hymns using full-text search, best matches first"""
+        fts_query = build_fts_query(query)
+        if not fts_query:
+            return []
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                    SELECT h.*, c.name as category_name
-                    FROM hymns h
+                    SELECT h.*, c.name as category_name, bm25(hymns_fts) as rank
+                    FROM hymns_fts
+                    JOIN hymns h ON h.id = hymns_fts.rowid
                     LEFT JOIN categories c ON h.category_id = c.id
-                    WHERE h.id IN (
-                        SELECT rowid FROM hymns_fts 
-                        WHERE hymns_fts MATCH ?
-                    )
-                    ORDER BY h.number
+                    WHERE hymns_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
                     """,
-                    (query,),
+                    (fts_query, limit),
                 )
                 return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
@@ -185,23 +365,40 @@ class DatabaseManager:
 
     def get_all_hymns(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all hymns"""
+        return list(self.iter_all_hymns(limit))
+
+    def iter_all_hymns(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield all hymns as they are read from the database"""
+        # LIMIT -1 means no limit in SQLite, so one statement covers both
+        return self._iter_rows(
+            SQL_ALL_HYMNS, (limit if limit else -1,), "Error fetching all hymns"
+        )
+
+    def get_hymn_summaries(self) -> List[sqlite3.Row]:
+        """Get id, number, title and category_name of every hymn, for list views
+
+        Rows are returned as sqlite3.Row (read with row["title"]) without the
+        verses, so listing the whole hymnal stays cheap.
+        """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                query = """
-                    SELECT h.*, c.name as category_name
-                    FROM hymns h
-                    LEFT JOIN categories c ON h.category_id = c.id
-                    ORDER BY h.number
-                """
-                if limit:
-                    query += f" LIMIT {limit}"
-                cursor.execute(query)
-                return [dict(row) for row in cursor.fetchall()]
+                return conn.execute(SQL_HYMN_SUMMARIES).fetchall()
         except Exception as e:
-            logger.error(f"Error fetching all hymns: {e}")
+            logger.error(f"Error fetching hymn summaries: {e}")
             return []
 
+    def _iter_rows(self, sql: str, params: tuple, error_message: str) -> Iterator[Dict[str, Any]]:
+        """Yield query results one row at a time
+
+        The database lock is held until the generator is exhausted or closed.
+        """
+        try:
+            with self.get_connection() as conn:
+                for row in conn.execute(sql, params):
+                    yield dict(row)
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+
     def get_favorites(self) -> List[Dict[str, Any]]:
         """Get all favorite hymns"""
         try:
@@ -251,11 +448,8 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT COUNT(*) as count FROM favorites WHERE hymn_id = ?",
-                    (hymn_id,),
-                )
-                return cursor.fetchone()["count"] > 0
+                cursor.execute(SQL_IS_FAVORITE, (hymn_id,))
+                return bool(cursor.fetchone()[0])
         except Exception as e:
             logger.error(f"Error checking favorite status: {e}")
             return False
@@ -265,22 +459,8 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO recently_viewed (hymn_id) VALUES (?)",
-                    (hymn_id,),
-                )
-
-                # Update usage stats
-                cursor.execute(
-                    """
-                    INSERT INTO usage_stats (hymn_id, view_count, last_viewed)
-                    VALUES (?, 1, CURRENT_TIMESTAMP)
-                    ON CONFLICT(hymn_id) DO UPDATE SET
-                        view_count = view_count + 1,
-                        last_viewed = CURRENT_TIMESTAMP
-                    """,
-                    (hymn_id,),
-                )
+                # usage_stats is updated by a trigger on recently_viewed
+                cursor.execute(SQL_ADD_RECENTLY_VIEWED, (hymn_id,))
                 return True
         except Exception as e:
             logger.error(f"Error adding to recently viewed: {e}")
@@ -293,11 +473,11 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                    SELECT DISTINCT h.*, c.name as category_name, r.viewed_at
+                    SELECT h.*, c.name as category_name, r.viewed_at
                     FROM recently_viewed r
                     JOIN hymns h ON r.hymn_id = h.id
                     LEFT JOIN categories c ON h.category_id = c.id
-                    ORDER BY r.viewed_at DESC
+                    ORDER BY r.viewed_at DESC, r.id DESC
                     LIMIT ?
                     """,
                     (limit,),
@@ -309,6 +489,9 @@ class DatabaseManager:
 
     def get_categories(self) -> List[Dict[str, Any]]:
         """Get all categories"""
+        with self._lock:
+            if self._categories_cache is not None:
+                return [dict(category) for category in self._categories_cache]
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -321,39 +504,35 @@ class DatabaseManager:
                     ORDER BY c.name
                     """
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                self._categories_cache = [dict(row) for row in cursor.fetchall()]
+                return [dict(category) for category in self._categories_cache]
         except Exception as e:
             logger.error(f"Error fetching categories: {e}")
             return []
 
     def get_hymns_by_category(self, category_id: int) -> List[Dict[str, Any]]:
         """Get all hymns in a category"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT h.*, c.name as category_name
-                    FROM hymns h
-                    LEFT JOIN categories c ON h.category_id = c.id
-                    WHERE h.category_id = ?
-                    ORDER BY h.number
-                    """,
-                    (category_id,),
-                )
-                return [dict(row) for row in cursor.fetchall()]
-        except Exception as e:
-            logger.error(f"Error fetching hymns by category: {e}")
-            return []
+        return list(self.iter_hymns_by_category(category_id))
+
+    def iter_hymns_by_category(self, category_id: int) -> Iterator[Dict[str, Any]]:
+        """Yield the hymns in a category as they are read from the database"""
+        return self._iter_rows(
+            SQL_HYMNS_BY_CATEGORY, (category_id,), "Error fetching hymns by category"
+        )
 
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value"""
+        with self._lock:
+            if key in self._setting_cache:
+                return self._setting_cache[key]
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
                 row = cursor.fetchone()
-                return row["value"] if row else None
+                value = row["value"] if row else None
+                self._setting_cache[key] = value
+                return value
         except Exception as e:
             logger.error(f"Error fetching setting {key}: {e}")
             return None
@@ -372,37 +551,34 @@ class DatabaseManager:
                     """,
                     (key, value),
                 )
-                return True
+                # Still under the connection lock, so a concurrent get_setting()
+                # miss can't refill the cache with the old value in between
+                self._setting_cache[key] = value
+            return True
         except Exception as e:
+            # The write may not have committed; let the next read go to the database
+            with self._lock:
+                self._setting_cache.pop(key, None)
             logger.error(f"Error setting {key}: {e}")
             return False
 
+    def _get_database_size(self) -> int:
+        """Size of the database file, re-read at most every DATABASE_SIZE_TTL seconds"""
+        now = time.monotonic()
+        if self._database_size is None or now - self._database_size[0] > DATABASE_SIZE_TTL:
+            self._database_size = (now, self.db_path.stat().st_size)
+        return self._database_size[1]
+
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-
-                stats = {}
-
-                # Count hymns
-                cursor.execute("SELECT COUNT(*) as count FROM hymns")
-                stats["total_hymns"] = cursor.fetchone()["count"]
-
-                # Count categories
-                cursor.execute("SELECT COUNT(*) as count FROM categories")
-                stats["total_categories"] = cursor.fetchone()["count"]
-
-                # Count favorites
-                cursor.execute("SELECT COUNT(*) as count FROM favorites")
-                stats["total_favorites"] = cursor.fetchone()["count"]
+                cursor.execute(SQL_DATABASE_STATS)
+                stats = dict(cursor.fetchone())
 
                 # Database size
-                stats["database_size"] = self.db_path.stat().st_size
-
-                # Version
-                cursor.execute("SELECT value FROM db_metadata WHERE key = 'version'")
-                stats["database_version"] = cursor.fetchone()["value"]
+                stats["database_size"] = self._get_database_size()
 
                 return stats
 
@@ -2,12 +2,17 @@
 Database models and data classes for Christ In Song Hymnal
 File: src/christ_in_song/database/models.py
 """
+import sqlite3
+import sys
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Hymn:
     """Hymn data model"""
 
@@ -48,19 +53,39 @@ class Hymn:
             updated_at=data.get("updated_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Hymn":
+        """Create a Hymn instance directly from a `SELECT h.*` row"""
+        return cls(
+            id=row["id"],
+            number=row["number"],
+            title=row["title"],
+            verses=row["verses"],
+            chorus=row["chorus"],
+            category_id=row["category_id"],
+            category_name=row["category_name"] if "category_name" in row.keys() else None,
+            author=row["author"],
+            composer=row["composer"],
+            year=row["year"],
+            copyright=row["copyright"],
+            scripture_reference=row["scripture_reference"],
+            notes=row["notes"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
     def get_verse_list(self) -> list:
         """Split verses into a list"""
         return [v.strip() for v in self.verses.split("\n\n") if v.strip()]
 
     def get_full_text(self) -> str:
         """Get the full text of the hymn including chorus"""
-        text = self.verses
         if self.chorus:
-            text += "\n\nChorus:\n" + self.chorus
-        return text
+            return f"{self.verses}\n\nChorus:\n{self.chorus}"
+        return self.verses
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Category:
     """Category data model"""
 
@@ -81,8 +106,19 @@ class Category:
             created_at=data.get("created_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Category":
+        """Create a Category instance directly from a `SELECT c.*` row"""
+        return cls(
+            id=row["id"],
+            name=row["name"],
+            description=row["description"],
+            hymn_count=row["hymn_count"] if "hymn_count" in row.keys() else 0,
+            created_at=row["created_at"],
+        )
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Favorite:
     """Favorite hymn data model"""
 
@@ -103,7 +139,7 @@ class Favorite:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RecentlyViewed:
     """Recently viewed hymn data model"""
 
@@ -122,7 +158,7 @@ class RecentlyViewed:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class UsageStat:
     """Usage statistics data model"""
 
@@ -2,9 +2,37 @@
 Database schema definitions for Christ In Song Hymnal
 File: src/christ_in_song/database/schema.py
 """
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Stored in PRAGMA user_version once SCHEMA has been applied. Bump it whenever
+# SCHEMA changes so existing databases pick the change up on next start.
+SCHEMA_VERSION = 4
+
+# Triggers to keep FTS index in sync with hymns table. Kept separate from
+# SCHEMA so bulk loads can drop them and rebuild the index in one pass.
+HYMNS_FTS_TRIGGERS = {
+    "hymns_ai": """
+CREATE TRIGGER IF NOT EXISTS hymns_ai AFTER INSERT ON hymns BEGIN
+    INSERT INTO hymns_fts(rowid, title, verses, author, composer)
+    VALUES (new.id, new.title, new.verses, new.author, new.composer);
+END;""",
+    "hymns_ad": """
+CREATE TRIGGER IF NOT EXISTS hymns_ad AFTER DELETE ON hymns BEGIN
+    DELETE FROM hymns_fts WHERE rowid = old.id;
+END;""",
+    "hymns_au": """
+CREATE TRIGGER IF NOT EXISTS hymns_au AFTER UPDATE ON hymns BEGIN
+    DELETE FROM hymns_fts WHERE rowid = old.id;
+    INSERT INTO hymns_fts(rowid, title, verses, author, composer)
+    VALUES (new.id, new.title, new.verses, new.author, new.composer);
+END;""",
+}
 
 # SQL schema for creating all database tables
-SCHEMA = """
+SCHEMA = (
+    """
 -- Categories table for organizing hymns
 CREATE TABLE IF NOT EXISTS categories (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -35,7 +63,9 @@ CREATE TABLE IF NOT EXISTS hymns (
 -- Indexes for fast lookups
 CREATE INDEX IF NOT EXISTS idx_hymn_number ON hymns(number);
 CREATE INDEX IF NOT EXISTS idx_hymn_title ON hymns(title);
-CREATE INDEX IF NOT EXISTS idx_hymn_category ON hymns(category_id);
+-- Category listings are ordered by number, so index both to skip the sort
+DROP INDEX IF EXISTS idx_hymn_category;
+CREATE INDEX IF NOT EXISTS idx_hymn_category_number ON hymns(category_id, number);
 
 -- Full-text search virtual table for searching hymns
 CREATE VIRTUAL TABLE IF NOT EXISTS hymns_fts USING fts5(
@@ -48,20 +78,9 @@ CREATE VIRTUAL TABLE IF NOT EXISTS hymns_fts USING fts5(
 );
 
 -- Triggers to keep FTS index in sync with hymns table
-CREATE TRIGGER IF NOT EXISTS hymns_ai AFTER INSERT ON hymns BEGIN
-    INSERT INTO hymns_fts(rowid, title, verses, author, composer)
-    VALUES (new.id, new.title, new.verses, new.author, new.composer);
-END;
-
-CREATE TRIGGER IF NOT EXISTS hymns_ad AFTER DELETE ON hymns BEGIN
-    DELETE FROM hymns_fts WHERE rowid = old.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS hymns_au AFTER UPDATE ON hymns BEGIN
-    DELETE FROM hymns_fts WHERE rowid = old.id;
-    INSERT INTO hymns_fts(rowid, title, verses, author, composer)
-    VALUES (new.id, new.title, new.verses, new.author, new.composer);
-END;
+"""
+    + "\n".join(HYMNS_FTS_TRIGGERS.values())
+    + """
 
 -- User favorites table
 CREATE TABLE IF NOT EXISTS favorites (
@@ -73,6 +92,8 @@ CREATE TABLE IF NOT EXISTS favorites (
     UNIQUE(hymn_id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_favorites_added ON favorites(added_at DESC);
+
 -- Recently viewed hymns
 CREATE TABLE IF NOT EXISTS recently_viewed (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,6 +104,12 @@ CREATE TABLE IF NOT EXISTS recently_viewed (
 
 CREATE INDEX IF NOT EXISTS idx_recently_viewed_time ON recently_viewed(viewed_at DESC);
 
+-- One row per hymn holding its latest view; older databases logged every view
+DELETE FROM recently_viewed WHERE id NOT IN (
+    SELECT MAX(id) FROM recently_viewed GROUP BY hymn_id
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_recently_viewed_hymn ON recently_viewed(hymn_id);
+
 -- Application settings
 CREATE TABLE IF NOT EXISTS settings (
     key TEXT PRIMARY KEY,
@@ -99,6 +126,16 @@ CREATE TABLE IF NOT EXISTS usage_stats (
     FOREIGN KEY (hymn_id) REFERENCES hymns(id) ON DELETE CASCADE
 );
 
+-- Count views as they're recorded; re-viewing a hymn replaces its
+-- recently_viewed row, which fires this again
+CREATE TRIGGER IF NOT EXISTS recently_viewed_usage_stats AFTER INSERT ON recently_viewed BEGIN
+    INSERT INTO usage_stats (hymn_id, view_count, last_viewed)
+    VALUES (new.hymn_id, 1, CURRENT_TIMESTAMP)
+    ON CONFLICT(hymn_id) DO UPDATE SET
+        view_count = view_count + 1,
+        last_viewed = CURRENT_TIMESTAMP;
+END;
+
 -- Database metadata
 CREATE TABLE IF NOT EXISTS db_metadata (
     key TEXT PRIMARY KEY,
@@ -110,6 +147,7 @@ CREATE TABLE IF NOT EXISTS db_metadata (
 INSERT OR IGNORE INTO db_metadata (key, value) VALUES ('version', '1.0.0');
 INSERT OR IGNORE INTO db_metadata (key, value) VALUES ('created_at', datetime('now'));
 """
+)
 
 # Default categories
 DEFAULT_CATEGORIES = [
@@ -131,103 +169,15 @@ DEFAULT_CATEGORIES = [
     ("Special Occasions", "Hymns for special occasions"),
 ]
 
-# Sample hymn data for testing
-SAMPLE_HYMNS = [
-    {
-        "number": 1,
-        "title": "Holy, Holy, Holy",
-        "verses": """1. Holy, holy, holy! Lord God Almighty!
-Early in the morning our song shall rise to Thee;
-Holy, holy, holy! Merciful and mighty!
-God in three Persons, blessèd Trinity!
-
-2. Holy, holy, holy! All the saints adore Thee,
-Casting down their golden crowns around the glassy sea;
-Cherubim and seraphim falling down before Thee,
-Which wert, and art, and evermore shalt be.
-
-3. Holy, holy, holy! Though the darkness hide Thee,
-Though the eye of sinful man Thy glory may not see,
-Only Thou art holy; there is none beside Thee
-Perfect in power, in love, and purity.
-
-4. Holy, holy, holy! Lord God Almighty!
-All Thy works shall praise Thy name in earth and sky and sea;
-Holy, holy, holy! Merciful and mighty!
-God in three Persons, blessèd Trinity!""",
-        "chorus": None,
-        "category": "Worship and Praise",
-        "author": "Reginald Heber",
-        "composer": "John B. Dykes",
-        "year": 1826,
-        "scripture_reference": "Revelation 4:8",
-    },
-    {
-        "number": 2,
-        "title": "Amazing Grace",
-        "verses": """1. Amazing grace! How sweet the sound
-That saved a wretch like me!
-I once was lost, but now am found,
-Was blind, but now I see.
-
-2. 'Twas grace that taught my heart to fear,
-And grace my fears relieved;
-How precious did that grace appear
-The hour I first believed!
-
-3. Through many dangers, toils and snares,
-I have already come;
-'Tis grace hath brought me safe thus far,
-And grace will lead me home.
-
-4. When we've been there ten thousand years,
-Bright shining as the sun,
-We've no less days to sing God's praise
-Than when we'd first begun.""",
-        "chorus": None,
-        "category": "Salvation",
-        "author": "John Newton",
-        "composer": "Traditional",
-        "year": 1779,
-        "scripture_reference": "Ephesians 2:8",
-    },
-    {
-        "number": 3,
-        "title": "What a Friend We Have in Jesus",
-        "verses": """1. What a friend we have in Jesus,
-All our sins and griefs to bear!
-What a privilege to carry
-Everything to God in prayer!
-O what peace we often forfeit,
-O what needless pain we bear,
-All because we do not carry
-Everything to God in prayer!
-
-2. Have we trials and temptations?
-Is there trouble anywhere?
-We should never be discouraged;
-Take it to the Lord in prayer.
-Can we find a friend so faithful
-Who will all our sorrows share?
-Jesus knows our every weakness;
-Take it to the Lord in prayer.
-
-3. Are we weak and heavy laden,
-Cumbered with a load of care?
-Precious Savior, still our refuge,
-Take it to the Lord in prayer.
-Do thy friends despise, forsake thee?
-Take it to the Lord in prayer!
-In His arms He'll take and shield thee;
-Thou wilt find a solace there.""",
-        "chorus": None,
-        "category": "Prayer",
-        "author": "Joseph M. Scriven",
-        "composer": "Charles C. Converse",
-        "year": 1855,
-        "scripture_reference": "John 15:15",
-    },
-]
+# Sample hymn data for testing. Kept in JSON and only read when a new
+# database is seeded, so importing this module stays cheap.
+SAMPLE_HYMNS_PATH = Path(__file__).parent / "sample_hymns.json"
+
+
+def load_sample_hymns() -> List[Dict[str, Any]]:
+    """Load the sample hymns used to seed a new database"""
+    return json.loads(SAMPLE_HYMNS_PATH.read_text(encoding="utf-8"))
+
 
 # Default application settings
 DEFAULT_SETTINGS = [
@@ -2,18 +2,16 @@
 Main application entry point for Christ In Song Hymnal
 File: src/christ_in_song/main.py
 """
+import atexit
 import sys
 import logging
-from pathlib import Path
-
-# PySide6 imports
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt
+import logging.handlers
 
 from christ_in_song.config import Config
 from christ_in_song.database.connection import DatabaseManager
-from christ_in_song.ui.main_window import MainWindow
+
+# PySide6 and the UI modules are imported inside the functions that use them,
+# so logging is up before the Qt libraries are loaded
 
 
 def setup_logging() -> None:
@@ -23,15 +21,30 @@ def setup_logging() -> None:
 
     log_file = log_dir / "christ_in_song.log"
 
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    # Buffer file writes; errors and shutdown flush the buffer immediately.
+    # The target formats records itself, so it needs its own formatter.
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=128, flushLevel=logging.ERROR, target=file_handler
+    )
+    # Registered in reverse: flush the buffer, then close the file
+    atexit.register(file_handler.close)
+    atexit.register(buffered_handler.flush)
+
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)],
+        format=log_format,
+        handlers=[buffered_handler, logging.StreamHandler(sys.stdout)],
     )
 
 
 def show_error_dialog(title: str, message: str) -> None:
     """Show an error dialog to the user"""
+    from PySide6.QtWidgets import QApplication, QMessageBox
+
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
@@ -49,11 +62,16 @@ def main() -> int:
     # Setup logging
     setup_logging()
     logger = logging.getLogger(__name__)
-    logger.info("=" * 70)
-    logger.info("Starting Christ In Song Hymnal v%s", Config.VERSION)
-    logger.info("=" * 70)
+    logger.info("\n%s\nStarting Christ In Song Hymnal v%s\n%s", "=" * 70, Config.VERSION, "=" * 70)
 
     try:
+        # PySide6 imports
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QThreadPool
+
+        from christ_in_song.ui.main_window import MainWindow
+        from christ_in_song.ui.workers import DatabaseInitWorker
+
         # Create Qt Application
         app = QApplication(sys.argv)
         app.setApplicationName("Christ In Song")
@@ -61,55 +79,76 @@ def main() -> int:
         app.setOrganizationName("Christ In Song")
 
         # Set application icon
-        icon_path = Config.get_resource_path("icons/app_icon.ico")
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
-
-        # Enable high DPI scaling
-        app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
-        app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
+        app_icon = Config.get_app_icon()
+        if app_icon is not None:
+            app.setWindowIcon(app_icon)
 
-        logger.info("Initializing database...")
-        print("\n🔄 Initializing database...\n")
-
-        # Initialize database
+        # Show the window right away; the database is set up in the background
         db_manager = DatabaseManager()
-        if not db_manager.initialize_database():
-            error_msg = (
-                "Failed to initialize the database.\n\n"
-                "Please check the log file for details:\n"
-                f"{Config.get_user_data_dir() / 'logs' / 'christ_in_song.log'}"
-            )
-            logger.error("Database initialization failed")
-            show_error_dialog("Database Error", error_msg)
-            return 1
-
-        logger.info("Database initialized successfully")
-        print("✅ Database initialized successfully!\n")
-
-        # Show database stats
-        stats = db_manager.get_database_stats()
-        logger.info("Database statistics:")
-        logger.info("  Total hymns: %d", stats["total_hymns"])
-        logger.info("  Total categories: %d", stats["total_categories"])
-        logger.info("  Total favorites: %d", stats["total_favorites"])
-        logger.info("  Database size: %d bytes", stats["database_size"])
-
-        print("📊 Database Statistics:")
-        print(f"  • Total hymns: {stats['total_hymns']}")
-        print(f"  • Total categories: {stats['total_categories']}")
-        print(f"  • Total favorites: {stats['total_favorites']}")
-        print(f"  • Database location: {db_manager.db_path}")
-        print()
-
-        # Create and show main window - PASS db_manager HERE
         logger.info("Creating main window...")
-        main_window = MainWindow(db_manager)  # ← THIS IS THE CRITICAL LINE
+        main_window = MainWindow(db_manager)
         main_window.show()
+        main_window.statusBar().showMessage("Initializing database...")
+        # Paint the window before the worker starts competing for the GIL
+        app.processEvents()
+
+        def on_database_ready(success: bool) -> None:
+            if not success:
+                error_msg = (
+                    "Failed to initialize the database.\n\n"
+                    "Please check the log file for details:\n"
+                    f"{Config.get_user_data_dir() / 'logs' / 'christ_in_song.log'}"
+                )
+                logger.error("Database initialization failed")
+                show_error_dialog("Database Error", error_msg)
+                app.exit(1)
+                return
+
+            logger.info("Database initialized successfully")
+
+            # The stats only go to the console banner below; logging them too
+            # would print them twice, since the log also goes to stdout
+            stats = db_manager.get_database_stats()
+
+            main_window.statusBar().showMessage("Ready - Database connected - Plain text mode active")
+            logger.info("Application started successfully")
+
+            # One console write for the whole banner. Windowed builds have no
+            # console, in which case sys.stdout is None.
+            if sys.stdout is not None:
+                sys.stdout.write(
+                    "\n".join(
+                        [
+                            "✅ Database initialized successfully!",
+                            "",
+                            "📊 Database Statistics:",
+                            f"  • Total hymns: {stats['total_hymns']}",
+                            f"  • Total categories: {stats['total_categories']}",
+                            f"  • Total favorites: {stats['total_favorites']}",
+                            f"  • Database location: {db_manager.db_path}",
+                            "",
+                            "🎵 Christ In Song Hymnal is now running!",
+                            "",
+                            "=" * 70,
+                        ]
+                    )
+                    + "\n"
+                )
+                sys.stdout.flush()
 
-        logger.info("Application started successfully")
-        print("🎵 Christ In Song Hymnal is now running!\n")
-        print("=" * 70)
+        logger.info("Initializing database...")
+        # Written now rather than with the banner: the banner can only be
+        # written once the worker below has finished
+        if sys.stdout is not None:
+            sys.stdout.write("\n🔄 Initializing database...\n\n")
+            sys.stdout.flush()
+
+        app.aboutToQuit.connect(db_manager.close)
+
+        # Keep a reference so the worker's signals outlive the task
+        init_worker = DatabaseInitWorker(db_manager)
+        init_worker.signals.finished.connect(on_database_ready)
+        QThreadPool.globalInstance().start(init_worker)
 
         # Run application event loop
         return_code = app.exec()
@@ -6,8 +6,147 @@ from PySide6.QtWidgets import (QMainWindow, QLabel, QVBoxLayout, QWidget,
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from christ_in_song.config import Config
+from collections import OrderedDict
+from functools import lru_cache
 import re
-import html
+
+# One stylesheet for the whole window, applied once in init_ui(); widgets
+# pick up their rules through their object names
+_WINDOW_QSS = """
+    QLabel#headerLabel {
+        font-size: 24px;
+        font-weight: bold;
+        padding: 20px;
+        color: #2c3e50;
+        background: #ecf0f1;
+        border-radius: 8px;
+        margin: 10px;
+    }
+
+    QPlainTextEdit#hymnContent {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        padding: 15px;
+        background: white;
+        line-height: 1.6;
+    }
+
+    QPushButton#primaryBtn, QPushButton#dangerBtn, QPushButton#mutedBtn {
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QPushButton#primaryBtn { background: #3498db; }
+    QPushButton#primaryBtn:hover { background: #2980b9; }
+    QPushButton#dangerBtn { background: #e74c3c; }
+    QPushButton#dangerBtn:hover { background: #c0392b; }
+    QPushButton#mutedBtn { background: #95a5a6; }
+    QPushButton#mutedBtn:hover { background: #7f8c8d; }
+"""
+
+
+# Rendered hymn texts kept by each window, most recently shown last
+HYMN_TEXT_CACHE_SIZE = 64
+
+# Shown at startup and by the "Load Test Hymn" button
+SAMPLE_HYMN_TEXT = """Hymn #1: Holy, Holy, Holy
+
+Verse 1:
+Holy, holy, holy! Lord God Almighty!
+Early in the morning our song shall rise to Thee;
+Holy, holy, holy! Merciful and mighty!
+God in three Persons, blessed Trinity!
+
+Verse 2:
+Holy, holy, holy! All the saints adore Thee,
+Casting down their golden crowns around the glassy sea;
+Cherubim and seraphim falling down before Thee,
+Which wert, and art, and evermore shalt be.
+
+Verse 3:
+Holy, holy, holy! Though the darkness hide Thee,
+Though the eye of sinful man Thy glory may not see,
+Only Thou art holy; there is none beside Thee
+Perfect in power, in love, and purity.
+
+Verse 4:
+Holy, holy, holy! Lord God Almighty!
+All Thy works shall praise Thy name in earth and sky and sea;
+Holy, holy, holy! Merciful and mighty!
+God in three Persons, blessed Trinity!
+
+Author: Reginald Heber, 1826
+Composer: John B. Dykes, 1861
+"""
+
+
+# Shown, after cleaning, by the "Test HTML Input" button
+HTML_TEST_SAMPLE = """<h1>Hymn #123</h1>
+<p><strong>Title:</strong> Amazing Grace</p>
+<div class="verse">
+<p>Amazing grace! How sweet the sound<br/>
+That saved a wretch like me!<br/>
+I once was lost, but now am found;<br/>
+Was blind, but now I see.</p>
+</div>
+<p><em>Author:</em> John Newton &amp; more &lt;tags&gt;</p>"""
+
+
+# Patterns used by MainWindow.clean_html_to_text(), compiled once at import
+_LINE_BREAK_TAG_RE = re.compile(r'<(?:br\s*/?|/?p|/?div[^>]*|/?h[1-6][^>]*)>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_SPACES_RE = re.compile(r'[ \t]+')
+_LINE_EDGE_SPACES_RE = re.compile(r' *\n *')
+
+
+def _is_plain_text(text: str) -> bool:
+    """True if no cleaning pass would change text apart from the final strip()"""
+    return not (
+        '<' in text or '&' in text or '\t' in text
+        or '  ' in text or ' \n' in text or '\n ' in text
+        or _BLANK_LINES_RE.search(text)
+    )
+
+
+def _as_text(text) -> str:
+    """Stand-in for clean_html_to_text() when a field is known to be plain text"""
+    return text if isinstance(text, str) else ""
+
+
+# Titles, authors and composers repeat across the hymnal, so the cleaned
+# text is cached per input string
+@lru_cache(maxsize=2048)
+def _clean_html_to_text(text: str) -> str:
+    """Implementation of MainWindow.clean_html_to_text() for non-empty strings"""
+    # Imported here: html pulls in the full entity table, and plain-text
+    # sessions never get this far
+    import html
+    
+    # Convert <br>, <p>, <div> and heading tags to newlines in one pass; the
+    # whitespace cleanup below turns "</p> <p>" into a paragraph break
+    text = _LINE_BREAK_TAG_RE.sub('\n', text)
+    
+    # Remove all other HTML tags
+    text = _TAG_RE.sub('', text)
+    
+    # Decode HTML entities
+    text = html.unescape(text)
+    
+    # Clean up excessive whitespace
+    text = _BLANK_LINES_RE.sub('\n\n', text)  # Max 2 consecutive newlines
+    text = _SPACES_RE.sub(' ', text)  # Multiple spaces to single space
+    text = _LINE_EDGE_SPACES_RE.sub('\n', text)  # Remove spaces around newlines
+    
+    return text.strip()
+
+
+@lru_cache(maxsize=None)
+def _hymn_font(size: int = Config.DEFAULT_FONT_SIZE) -> QFont:
+    """Font for hymn text at the given size, resolved once per size (needs a QApplication)"""
+    return QFont("Segoe UI", size)
 
 
 class MainWindow(QMainWindow):
@@ -22,12 +161,14 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.db_manager = db_manager
+        self._hymn_text_cache: "OrderedDict[tuple, str]" = OrderedDict()
         self.init_ui()
     
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle(f"{Config.APP_NAME} v{Config.VERSION}")
         self.setGeometry(100, 100, Config.DEFAULT_WINDOW_WIDTH, Config.DEFAULT_WINDOW_HEIGHT)
+        self.setStyleSheet(_WINDOW_QSS)
         
         # Create central widget
         central_widget = QWidget()
@@ -40,17 +181,7 @@ class MainWindow(QMainWindow):
         # Add header
         header_label = QLabel("🎵 Christ In Song Hymnal")
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                padding: 20px;
-                color: #2c3e50;
-                background: #ecf0f1;
-                border-radius: 8px;
-                margin: 10px;
-            }
-        """)
+        header_label.setObjectName("headerLabel")
         layout.addWidget(header_label)
         
         # Create hymn display area using QPlainTextEdit for pure text
@@ -58,19 +189,11 @@ class MainWindow(QMainWindow):
         self.hymn_content.setReadOnly(True)
         
         # Set font for hymn content
-        font = QFont("Segoe UI", 12)
-        self.hymn_content.setFont(font)
+        self.font_size = Config.DEFAULT_FONT_SIZE
+        self.hymn_content.setFont(_hymn_font(self.font_size))
         
         # Style the text edit
-        self.hymn_content.setStyleSheet("""
-            QPlainTextEdit {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 15px;
-                background: white;
-                line-height: 1.6;
-            }
-        """)
+        self.hymn_content.setObjectName("hymnContent")
         
         # Add sample hymn text
         self.display_sample_hymn()
@@ -82,53 +205,17 @@ class MainWindow(QMainWindow):
         
         test_btn = QPushButton("Load Test Hymn")
         test_btn.clicked.connect(self.display_sample_hymn)
-        test_btn.setStyleSheet("""
-            QPushButton {
-                background: #3498db;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #2980b9;
-            }
-        """)
+        test_btn.setObjectName("primaryBtn")
         button_layout.addWidget(test_btn)
         
         test_html_btn = QPushButton("Test HTML Input")
         test_html_btn.clicked.connect(self.display_html_test)
-        test_html_btn.setStyleSheet("""
-            QPushButton {
-                background: #e74c3c;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #c0392b;
-            }
-        """)
+        test_html_btn.setObjectName("dangerBtn")
         button_layout.addWidget(test_html_btn)
         
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self.hymn_content.clear)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background: #95a5a6;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #7f8c8d;
-            }
-        """)
+        clear_btn.setObjectName("mutedBtn")
         button_layout.addWidget(clear_btn)
         
         layout.addLayout(button_layout)
@@ -139,52 +226,13 @@ class MainWindow(QMainWindow):
     
     def display_sample_hymn(self):
         """Display a sample hymn in plain text format"""
-        sample_text = """Hymn #1: Holy, Holy, Holy
-
-Verse 1:
-Holy, holy, holy! Lord God Almighty!
-Early in the morning our song shall rise to Thee;
-Holy, holy, holy! Merciful and mighty!
-God in three Persons, blessed Trinity!
-
-Verse 2:
-Holy, holy, holy! All the saints adore Thee,
-Casting down their golden crowns around the glassy sea;
-Cherubim and seraphim falling down before Thee,
-Which wert, and art, and evermore shalt be.
-
-Verse 3:
-Holy, holy, holy! Though the darkness hide Thee,
-Though the eye of sinful man Thy glory may not see,
-Only Thou art holy; there is none beside Thee
-Perfect in power, in love, and purity.
-
-Verse 4:
-Holy, holy, holy! Lord God Almighty!
-All Thy works shall praise Thy name in earth and sky and sea;
-Holy, holy, holy! Merciful and mighty!
-God in three Persons, blessed Trinity!
-
-Author: Reginald Heber, 1826
-Composer: John B. Dykes, 1861
-"""
-        self.hymn_content.setPlainText(sample_text)
+        self.hymn_content.setPlainText(SAMPLE_HYMN_TEXT)
         self.statusBar().showMessage("Sample hymn loaded")
     
     def display_html_test(self):
         """Test displaying HTML content as plain text"""
-        html_content = """<h1>Hymn #123</h1>
-<p><strong>Title:</strong> Amazing Grace</p>
-<div class="verse">
-<p>Amazing grace! How sweet the sound<br/>
-That saved a wretch like me!<br/>
-I once was lost, but now am found;<br/>
-Was blind, but now I see.</p>
-</div>
-<p><em>Author:</em> John Newton &amp; more &lt;tags&gt;</p>"""
-        
         # Clean and display
-        cleaned = self.clean_html_to_text(html_content)
+        cleaned = self.clean_html_to_text(HTML_TEST_SAMPLE)
         self.hymn_content.setPlainText(f"--- HTML INPUT CLEANED ---\n\n{cleaned}")
         self.statusBar().showMessage("HTML tags stripped successfully")
     
@@ -201,44 +249,64 @@ Was blind, but now I see.</p>
                 - composer: Composer name (optional)
                 - chorus: Chorus text (optional)
                 - year: Year (optional)
+                - content_type: 'text' if the fields are known to be plain
+                  text, which skips HTML cleaning (optional, default 'html')
         """
-        lines = []
+        # Key on everything the text is built from (including whether it is
+        # cleaned), so a hymn whose content changed under the same number and
+        # title is rendered again
+        key = (
+            hymn_data.get('number'),
+            hymn_data.get('title'),
+            tuple(hymn_data.get('verses', ())),
+            hymn_data.get('chorus'),
+            hymn_data.get('author'),
+            hymn_data.get('composer'),
+            hymn_data.get('year'),
+            hymn_data.get('content_type'),
+        )
+        hymn_text = self._hymn_text_cache.get(key)
+        if hymn_text is not None:
+            self._hymn_text_cache.move_to_end(key)
+        else:
+            hymn_text = self._build_hymn_text(hymn_data)
+            self._hymn_text_cache[key] = hymn_text
+            if len(self._hymn_text_cache) > HYMN_TEXT_CACHE_SIZE:
+                self._hymn_text_cache.popitem(last=False)
+        
+        self.hymn_content.setPlainText(hymn_text)
+        self.statusBar().showMessage(f"Displaying Hymn #{hymn_data.get('number', 'N/A')}")
+    
+    def _build_hymn_text(self, hymn_data: dict) -> str:
+        """Build the plain text shown by display_hymn()"""
+        if hymn_data.get('content_type') == 'text':
+            clean = _as_text
+        else:
+            clean = self.clean_html_to_text
         
         # Add title and number
-        title = self.clean_html_to_text(hymn_data.get('title', 'Unknown'))
-        lines.append(f"Hymn #{hymn_data.get('number', 'N/A')}: {title}")
-        lines.append("")
+        title = clean(hymn_data.get('title', 'Unknown'))
+        lines = [f"Hymn #{hymn_data.get('number', 'N/A')}: {title}", ""]
         
-        # Add verses
+        # Add verses (cleaning removes HTML tags if any)
         verses = hymn_data.get('verses', [])
         for i, verse in enumerate(verses, 1):
-            lines.append(f"Verse {i}:")
-            # Clean the verse text (remove HTML tags if any)
-            clean_verse = self.clean_html_to_text(verse)
-            lines.append(clean_verse)
-            lines.append("")
+            lines.extend((f"Verse {i}:", clean(verse), ""))
         
         # Add chorus if present
         if hymn_data.get('chorus'):
-            lines.append("Chorus:")
-            clean_chorus = self.clean_html_to_text(hymn_data['chorus'])
-            lines.append(clean_chorus)
-            lines.append("")
+            lines.extend(("Chorus:", clean(hymn_data['chorus']), ""))
         
         # Add author and composer
         if hymn_data.get('author'):
-            author = self.clean_html_to_text(hymn_data['author'])
-            lines.append(f"Author: {author}")
+            lines.append(f"Author: {clean(hymn_data['author'])}")
         if hymn_data.get('composer'):
-            composer = self.clean_html_to_text(hymn_data['composer'])
-            lines.append(f"Composer: {composer}")
+            lines.append(f"Composer: {clean(hymn_data['composer'])}")
         if hymn_data.get('year'):
             lines.append(f"Year: {hymn_data['year']}")
         
-        # Join all lines and display as plain text
-        hymn_text = "\n".join(lines)
-        self.hymn_content.setPlainText(hymn_text)
-        self.statusBar().showMessage(f"Displaying Hymn #{hymn_data.get('number', 'N/A')}")
+        # Join all lines into plain text
+        return "\n".join(lines)
     
     @staticmethod
     def clean_html_to_text(text: str) -> str:
@@ -260,31 +328,11 @@ Was blind, but now I see.</p>
         if not text or not isinstance(text, str):
             return ""
         
-        # Convert <br>, <br/>, <br /> to newlines
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        
-        # Convert <p> tags to paragraphs with double newlines
-        text = re.sub(r'</p>\s*<p>', '\n\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?p>', '\n', text, flags=re.IGNORECASE)
-        
-        # Convert <div> tags to newlines
-        text = re.sub(r'</?div[^>]*>', '\n', text, flags=re.IGNORECASE)
-        
-        # Convert heading tags to text with newlines
-        text = re.sub(r'<h[1-6][^>]*>(.*?)</h[1-6]>', r'\n\1\n', text, flags=re.IGNORECASE)
-        
-        # Remove all other HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Decode HTML entities
-        text = html.unescape(text)
-        
-        # Clean up excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Max 2 consecutive newlines
-        text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single space
-        text = re.sub(r' *\n *', '\n', text)  # Remove spaces around newlines
+        # Most stored text has no markup; skip the passes (and the cache)
+        if _is_plain_text(text):
+            return text.strip()
         
-        return text.strip()
+        return _clean_html_to_text(text)
     
     def set_font_size(self, size: int):
         """
@@ -293,9 +341,11 @@ Was blind, but now I see.</p>
         Args:
             size: Font size in points (recommended: 10-20)
         """
-        font = self.hymn_content.font()
-        font.setPointSize(size)
-        self.hymn_content.setFont(font)
+        if size != self.font_size:
+            # setFont() re-lays out the whole document, so skip it when
+            # nothing changes (e.g. repeated slider or zoom events)
+            self.font_size = size
+            self.hymn_content.setFont(_hymn_font(size))
         self.statusBar().showMessage(f"Font size changed to {size}pt")
     
     def display_raw_content(self, content: str):
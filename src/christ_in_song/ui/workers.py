@@ -0,0 +1,26 @@
+"""
+Background tasks run on Qt's global thread pool
+File: src/christ_in_song/ui/workers.py
+"""
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by background workers
+
+    QRunnable isn't a QObject, so workers carry their signals in one of these.
+    """
+
+    finished = Signal(bool)
+
+
+class DatabaseInitWorker(QRunnable):
+    """Runs DatabaseManager.initialize_database() off the GUI thread"""
+
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.signals = WorkerSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.db_manager.initialize_database())
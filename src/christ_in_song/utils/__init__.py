@@ -1,33 +1 @@
 """Utilities package for Christ In Song"""
-
-# ============================================================================
-# INSTRUCTIONS TO CREATE FILES
-# ============================================================================
-print("""
-╔══════════════════════════════════════════════════════════════════════════╗
-║                  CREATE DATABASE STUB FILES                               ║
-╚══════════════════════════════════════════════════════════════════════════╝
-
-Create these files in your project:
-
-1. src/christ_in_song/database/__init__.py (empty or copy from above)
-
-2. src/christ_in_song/database/connection.py
-   Copy the DatabaseManager class code above
-
-3. src/christ_in_song/ui/__init__.py (empty)
-
-4. src/christ_in_song/ui/main_window.py
-   Copy the MainWindow class code above
-
-5. src/christ_in_song/utils/__init__.py (empty)
-
-Then run these commands:
-
-cd C:\\Users\\carri\\Desktop\\work\\christ-in-song
-venv\\Scripts\\activate
-pip install -e .
-python -m christ_in_song.main
-
-You should see the application window open! ✅
-""")
\ No newline at end of file
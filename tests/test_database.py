@@ -3,12 +3,9 @@ Test script for database functionality
 File: tests/test_database.py
 Run with: python -m pytest tests/test_database.py -v
 """
-import pytest
-from pathlib import Path
-import sys
+import logging
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from christ_in_song.database.connection import DatabaseManager
 from christ_in_song.database.models import Hymn, Category
@@ -18,21 +15,21 @@ class TestDatabaseManager:
     """Test database manager functionality"""
 
     @pytest.fixture
-    def db_manager(self, tmp_path):
+    def db_manager(self, tmp_path, monkeypatch):
         """Create a temporary database for testing"""
-        # Override database path for testing
+        # Override database path for testing; monkeypatch restores it
         import christ_in_song.config as config
 
-        original_path = config.Config.get_database_path
-        config.Config.get_database_path = lambda: tmp_path / "test.db"
+        monkeypatch.setattr(
+            config.Config, "get_database_path", staticmethod(lambda: tmp_path / "test.db")
+        )
 
         db = DatabaseManager()
         db.initialize_database()
 
         yield db
 
-        # Restore original path
-        config.Config.get_database_path = original_path
+        db.close()
 
     def test_database_initialization(self, db_manager):
         """Test that database initializes correctly"""
@@ -41,6 +38,12 @@ class TestDatabaseManager:
         assert stats["total_hymns"] >= 3  # Sample hymns
         assert stats["total_categories"] >= 10
 
+    def test_reinitialize_skips_current_schema(self, db_manager):
+        """Test that re-running initialization on a current database is a no-op"""
+        before = db_manager.get_database_stats()
+        assert db_manager.initialize_database()
+        assert db_manager.get_database_stats()["total_hymns"] == before["total_hymns"]
+
     def test_get_hymn_by_number(self, db_manager):
         """Test retrieving hymn by number"""
         hymn = db_manager.get_hymn_by_number(1)
@@ -54,6 +57,20 @@ class TestDatabaseManager:
         assert len(results) > 0
         assert any("Amazing Grace" in r["title"] for r in results)
 
+    def test_search_hymns_punctuation(self, db_manager, caplog):
+        """Test that punctuation and stray operators don't break the FTS query"""
+        results = db_manager.search_hymns("grace.")
+        assert any("Amazing Grace" in r["title"] for r in results)
+        assert len(db_manager.search_hymns("grace", limit=1)) == 1
+
+        # Operators without a term on both sides are searched for as words
+        with caplog.at_level(logging.ERROR):
+            for query in ("NOT", "grace AND", "OR grace", "grace OR NOT", '"'):
+                db_manager.search_hymns(query)
+        assert not caplog.records
+        assert any("Amazing Grace" in r["title"] for r in db_manager.search_hymns("grace AND"))
+        assert db_manager.search_hymns("grace NOT amazing") == []
+
     def test_favorites(self, db_manager):
         """Test favorites functionality"""
         # Add favorite
@@ -80,6 +97,50 @@ class TestDatabaseManager:
         assert len(recent) >= 2
         assert recent[0]["number"] == 2  # Most recent first
 
+        # Viewing a hymn again moves it to the top without duplicating it
+        db_manager.add_recently_viewed(1)
+        recent = db_manager.get_recently_viewed(10)
+        assert [r["number"] for r in recent] == [1, 2]
+
+        # Every view is counted in usage_stats
+        hymn_id = db_manager.get_hymn_by_number(1)["id"]
+        row = db_manager.connection.execute(
+            "SELECT view_count FROM usage_stats WHERE hymn_id = ?", (hymn_id,)
+        ).fetchone()
+        assert row["view_count"] == 2
+
+    def test_iter_all_hymns(self, db_manager):
+        """Test streaming hymns, including stopping early"""
+        hymns = db_manager.iter_all_hymns()
+        assert next(hymns)["number"] == 1
+        hymns.close()
+
+        # Closing the generator ends its transaction
+        assert not db_manager.connection.in_transaction
+        assert db_manager.add_favorite(1)
+        assert len(list(db_manager.iter_all_hymns())) == len(db_manager.get_all_hymns())
+
+    def test_hymn_summaries(self, db_manager):
+        """Test the lightweight hymn listing"""
+        summaries = db_manager.get_hymn_summaries()
+        assert len(summaries) == len(db_manager.get_all_hymns())
+        assert summaries[0]["number"] == 1
+        assert "verses" not in summaries[0].keys()
+
+    def test_models_from_row(self, db_manager):
+        """Test building models straight from database rows"""
+        from christ_in_song.database.connection import SQL_GET_HYMN
+
+        row = db_manager.connection.execute(SQL_GET_HYMN, (1,)).fetchone()
+        hymn = Hymn.from_row(row)
+        assert hymn.number == 1
+        assert hymn == Hymn.from_dict(dict(row))
+
+        row = db_manager.connection.execute("SELECT * FROM categories").fetchone()
+        category = Category.from_row(row)
+        assert category.name == row["name"]
+        assert category.hymn_count == 0
+
     def test_categories(self, db_manager):
         """Test category functionality"""
         categories = db_manager.get_categories()
@@ -103,12 +164,29 @@ class TestDatabaseManager:
         assert db_manager.set_setting("theme", "dark")
         assert db_manager.get_setting("theme") == "dark"
 
+    def test_cached_hymn_is_a_copy(self, db_manager):
+        """Test that callers can't modify the cached hymn"""
+        hymn = db_manager.get_hymn_by_number(1)
+        hymn["title"] = "Changed"
+        assert db_manager.get_hymn_by_number(1)["title"] != "Changed"
+
     def test_backup(self, db_manager):
         """Test database backup"""
         backup_path = db_manager.backup_database()
         assert backup_path is not None
         assert backup_path.exists()
 
+        # The backup includes commits that may still be in the WAL
+        import sqlite3
+
+        db_manager.add_favorite(1)
+        backup_path = db_manager.backup_database()
+        backup = sqlite3.connect(str(backup_path))
+        try:
+            assert backup.execute("SELECT COUNT(*) FROM favorites").fetchone()[0] == 1
+        finally:
+            backup.close()
+
 
 # Standalone test function for quick verification
 def test_database_standalone():
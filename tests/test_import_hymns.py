@@ -0,0 +1,136 @@
+"""
+Tests for the hymnal import script helpers
+File: tests/test_import_hymns.py
+Run with: python -m pytest tests/test_import_hymns.py -v
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "import_hymns.py"
+
+
+@pytest.fixture(scope="module")
+def import_hymns():
+    """Load scripts/import_hymns.py as a module (scripts/ isn't a package)"""
+    spec = importlib.util.spec_from_file_location("import_hymns", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMatchCategoryKeyword:
+    """Test the single-pass keyword scanner"""
+
+    def test_no_keyword(self, import_hymns):
+        """Test that text without keywords gives None"""
+        assert import_hymns.match_category_keyword("") is None
+        assert import_hymns.match_category_keyword("a mighty fortress") is None
+
+    def test_longer_keyword_wins_over_its_prefix(self, import_hymns):
+        """Test that overlapping keywords resolve by CATEGORY_MAPPING order"""
+        assert import_hymns.match_category_keyword("sweet hour of prayer") == "prayer"
+        assert import_hymns.match_category_keyword("we pray") == "pray"
+
+    def test_priority_not_position(self, import_hymns):
+        """Test that the earliest keyword in CATEGORY_MAPPING wins, wherever it occurs"""
+        assert import_hymns.match_category_keyword("rest in his love") == "love"
+        assert import_hymns.match_category_keyword("peace and glory") == "glory"
+
+    def test_matches_substring_scan(self, import_hymns):
+        """Test agreement with a plain substring check per keyword"""
+        texts = [
+            "redeemed by grace at calvary",
+            "the prayer of faith",
+            "returning home to heaven",
+            "christmas in bethlehem",
+            "we serve in his service",
+        ]
+        for text in texts:
+            expected = next(
+                (k for k in import_hymns.CATEGORY_MAPPING if k in text), None
+            )
+            assert import_hymns.match_category_keyword(text) == expected
+
+
+class TestDetermineCategory:
+    """Test category selection for imported hymns"""
+
+    CATEGORY_MAP = {"Prayer": 1, "Worship and Praise": 2, "Christian Life": 3}
+
+    def test_title_decides_first(self, import_hymns):
+        """Test that a title keyword beats a higher-priority content keyword"""
+        category_id = import_hymns.determine_category(
+            "sweet hour of prayer", "glory to god", self.CATEGORY_MAP, 3
+        )
+        assert category_id == 1
+
+    def test_content_used_when_title_has_no_keyword(self, import_hymns):
+        """Test that the content is scanned when the title has no keyword"""
+        category_id = import_hymns.determine_category(
+            "holy, holy, holy", "glory to god", self.CATEGORY_MAP, 3
+        )
+        assert category_id == 2
+
+    def test_default_category(self, import_hymns):
+        """Test the fallback when nothing matches or the category is missing"""
+        assert import_hymns.determine_category("a hymn", "some words", self.CATEGORY_MAP, 3) == 3
+        # "Heaven" isn't in the map
+        assert import_hymns.determine_category("heaven", "", self.CATEGORY_MAP, 3) == 3
+
+
+class TestParseHymnContent:
+    """Test hymn content parsing"""
+
+    def test_empty_content(self, import_hymns):
+        """Test that empty content gives empty verses and no chorus"""
+        assert import_hymns.parse_hymn_content("") == ("", None)
+        assert import_hymns.parse_hymn_content(None) == ("", None)
+
+    def test_strips_lines_and_drops_blank_ones(self, import_hymns):
+        """Test that lines are stripped and blank lines removed"""
+        content = "1\n  Holy, holy, holy!  \n\n   \nLord God Almighty!\r\n2\nEarly in the morning"
+        assert import_hymns.parse_hymn_content(content) == (
+            "1\nHoly, holy, holy!\nLord God Almighty!\n2\nEarly in the morning",
+            None,
+        )
+
+
+class TestValidateHymn:
+    """Test validation of hymn entries from the JSON data"""
+
+    def test_complete_hymn(self, import_hymns):
+        """Test that a complete hymn is returned stripped"""
+        hymn = {"number": 1, "title": " Holy ", "content": " 1\nHoly "}
+        assert import_hymns.validate_hymn(hymn) == ((1, "Holy", "1\nHoly"), None)
+
+    def test_incomplete_hymns(self, import_hymns):
+        """Test that bad entries give a reason instead of raising"""
+        bad_entries = [
+            {"title": "Holy", "content": "x"},
+            {"number": 1, "title": None, "content": "x"},
+            {"number": 1, "title": 42, "content": "x"},
+            {"number": 1, "title": "Holy", "content": "   "},
+            {"number": 1, "title": "Holy", "content": ["x"]},
+            "not a hymn",
+        ]
+        for entry in bad_entries:
+            fields, problem = import_hymns.validate_hymn(entry)
+            assert fields is None
+            assert problem
+
+    def test_import_skips_bad_records(self, import_hymns, tmp_path, caplog):
+        """Test that one bad record is logged and skipped, not fatal"""
+        db = import_hymns.DatabaseManager(tmp_path / "import.db")
+        db.initialize_database()
+        try:
+            with caplog.at_level("WARNING"):
+                import_hymns.import_hymns(db, [
+                    {"number": 1, "title": "Sweet Hour of Prayer", "content": "1\nSweet hour"},
+                    {"number": 2, "title": 42, "content": "1\nBad title"},
+                ])
+            assert db.get_database_stats()["total_hymns"] == 1
+            assert "Skipping hymn 2: missing or non-text title" in caplog.text
+        finally:
+            db.close()
@@ -0,0 +1,143 @@
+"""
+Tests for the main window's HTML-to-text cleaning
+File: tests/test_main_window.py
+Run with: python -m pytest tests/test_main_window.py -v
+"""
+import os
+import pytest
+
+# Run Qt without a display (CI, SSH sessions)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6")
+
+from christ_in_song.ui.main_window import MainWindow
+
+clean = MainWindow.clean_html_to_text
+
+
+class TestCleanHtmlToText:
+    """Test MainWindow.clean_html_to_text"""
+
+    def test_empty_and_non_string(self):
+        """Test that empty and non-string input give an empty string"""
+        assert clean("") == ""
+        assert clean(None) == ""
+        assert clean(123) == ""
+        assert clean(["<p>x</p>"]) == ""
+
+    def test_plain_text_unchanged(self):
+        """Test that plain text passes through apart from outer whitespace"""
+        assert clean("Amazing grace") == "Amazing grace"
+        assert clean("  line one\nline two  ") == "line one\nline two"
+
+    def test_line_breaks_and_paragraphs(self):
+        """Test that <br> and <p> become newlines"""
+        assert clean("one<br>two<BR/>three<br />four") == "one\ntwo\nthree\nfour"
+        assert clean("<p>first</p><p>second</p>") == "first\n\nsecond"
+        assert clean('<div class="verse">verse</div>') == "verse"
+
+    def test_headings_and_tags(self):
+        """Test that headings keep their text and other tags are removed"""
+        assert clean("<h1>Hymn #1</h1>text") == "Hymn #1\ntext"
+        assert clean("<h2>Hymn #1<br>Holy</h2>text") == "Hymn #1\nHoly\ntext"
+        assert clean("<strong>Title:</strong> <em>Grace</em>") == "Title: Grace"
+
+    def test_entities_and_whitespace(self):
+        """Test entity decoding and whitespace collapsing"""
+        assert clean("John Newton &amp; more &lt;tags&gt;") == "John Newton & more <tags>"
+        assert clean("a   \t b") == "a b"
+        assert clean("a\n\n\n\nb") == "a\n\nb"
+
+    def test_html_test_sample(self):
+        """Test the sample used by the 'Test HTML Input' button"""
+        raw = (
+            "<h1>Hymn #123</h1>\n"
+            "<p><strong>Title:</strong> Amazing Grace</p>\n"
+            '<div class="verse">\n'
+            "<p>Amazing grace! How sweet the sound<br/>\n"
+            "That saved a wretch like me!</p>\n"
+            "</div>\n"
+            "<p><em>Author:</em> John Newton &amp; more &lt;tags&gt;</p>"
+        )
+        assert clean(raw) == (
+            "Hymn #123\n\n"
+            "Title: Amazing Grace\n\n"
+            "Amazing grace! How sweet the sound\n\n"
+            "That saved a wretch like me!\n\n"
+            "Author: John Newton & more <tags>"
+        )
+
+
+class TestDisplayHymn:
+    """Test MainWindow.display_hymn"""
+
+    @pytest.fixture
+    def window(self):
+        """Create a main window without a database"""
+        from PySide6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication([])
+        window = MainWindow()
+        yield window
+        window.deleteLater()
+
+    def test_display_hymn(self, window):
+        """Test the rendered text and that repeat displays reuse it"""
+        hymn = {
+            'number': 1,
+            'title': 'Holy, Holy, Holy',
+            'verses': ['Holy, holy, holy!<br>Lord God Almighty!'],
+            'author': 'Reginald Heber',
+        }
+        window.display_hymn(hymn)
+        text = window.hymn_content.toPlainText()
+        assert text == (
+            "Hymn #1: Holy, Holy, Holy\n\n"
+            "Verse 1:\nHoly, holy, holy!\nLord God Almighty!\n\n"
+            "Author: Reginald Heber"
+        )
+        assert len(window._hymn_text_cache) == 1
+
+        window.hymn_content.clear()
+        window.display_hymn(hymn)
+        assert window.hymn_content.toPlainText() == text
+        assert len(window._hymn_text_cache) == 1
+
+    def test_display_hymn_changed_content(self, window):
+        """Test that changed content under the same number and title is re-rendered"""
+        hymn = {'number': 1, 'title': 'X', 'verses': ['<b>a</b>']}
+        window.display_hymn(hymn)
+        assert window.hymn_content.toPlainText() == "Hymn #1: X\n\nVerse 1:\na\n"
+
+        window.display_hymn({**hymn, 'verses': ['b changed']})
+        assert window.hymn_content.toPlainText() == "Hymn #1: X\n\nVerse 1:\nb changed\n"
+
+        window.display_hymn({**hymn, 'author': 'Anon'})
+        assert window.hymn_content.toPlainText().endswith("Author: Anon")
+
+    def test_display_plain_text_hymn(self, window):
+        """Test that content_type 'text' shows fields without cleaning"""
+        window.display_hymn({
+            'number': 2,
+            'title': 'Rock of Ages',
+            'verses': ['Rock of Ages, cleft for me &amp; mine'],
+            'content_type': 'text',
+        })
+        assert window.hymn_content.toPlainText() == (
+            "Hymn #2: Rock of Ages\n\n"
+            "Verse 1:\nRock of Ages, cleft for me &amp; mine\n"
+        )
+
+    def test_display_hymn_both_content_types(self, window):
+        """Test that the same hymn renders correctly as text and as HTML, in either order"""
+        hymn = {'number': 3, 'title': 'Y', 'verses': ['a &amp; b']}
+        raw = "Hymn #3: Y\n\nVerse 1:\na &amp; b\n"
+        cleaned = "Hymn #3: Y\n\nVerse 1:\na & b\n"
+
+        window.display_hymn({**hymn, 'content_type': 'text'})
+        assert window.hymn_content.toPlainText() == raw
+        window.display_hymn(hymn)
+        assert window.hymn_content.toPlainText() == cleaned
+        window.display_hymn({**hymn, 'content_type': 'text'})
+        assert window.hymn_content.toPlainText() == raw